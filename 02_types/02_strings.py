@@ -2,7 +2,7 @@ first_name = "Kevin"
 last_name = "Cunningham"
 
 # concatenate -> join together!
-full_name = first_name + " " + last_name
+full_name = f"{first_name} {last_name}"
 print(full_name)
 
 'He said, "Hello"'
@@ -1,9 +1,10 @@
 # Customer Registration System
 
+BANNER = "=" * 50
 
-print("=" * 50)
+print(BANNER)
 print("Customer Registration")
-print("=" * 50)
+print(BANNER)
 print("Welcome! Please provide your information below.\n")
 
 # Collect customer information
@@ -22,9 +23,10 @@ company_input = input("Enter your company name (or press Enter to skip): ")
 company = None if company_input == "" else company_input
 
 # Display summary
-print("\n" + "=" * 50)
+print()
+print(BANNER)
 print("Registration Summary")
-print("=" * 50)
+print(BANNER)
 print(f"Name: {first_name} {last_name}")
 print(f"Email: {email}")
 print(f"Age: {age}")
@@ -33,12 +35,15 @@ if company is not None:
     print(f"Company: {company}")
 
 print("\nData Types:")
-print(f"  first_name: {type(first_name)}")
-print(f"  last_name: {type(last_name)}")
-print(f"  email: {type(email)}")
-print(f"  age: {type(age)}")
-print(f"  phone: {type(phone)}")
-print(f"  company: {type(company)}")
-
-print("=" * 50)
+for label, value in (
+    ("first_name", first_name),
+    ("last_name", last_name),
+    ("email", email),
+    ("age", age),
+    ("phone", phone),
+    ("company", company),
+):
+    print(f"  {label}: {type(value).__name__}")
+
+print(BANNER)
 print("✅ Registration complete!")
@@ -1,13 +1,18 @@
+PROGRAMME_MESSAGES = {
+  "news": "News programme starting.",
+  "quiz": "Quiz programme starting.",
+  "kids": "Kids programme starting.",
+}
+
 program_type = input("Enter the program type you'd like to watch: ").lower().strip()
 
-if program_type == "news":
-  print("News programme starting.")
-elif program_type == "quiz":  # contraction of else if
-  print("Quiz programme starting.")
-elif program_type == "kids":  # contraction of else if
-  print("Kids programme starting.")
-elif program_type.startswith("k"):
+message = PROGRAMME_MESSAGES.get(program_type)
+
+if message is not None:
+  print(message)
+# startswith also accepts a tuple - startswith(("k", "q")) checks every
+# prefix in one call if more are added later
+elif program_type.startswith("k"):  # contraction of else if
   print("Did you mean kids? Or something else beginning with k?")
 else:
   print("Unknown program type.")
-
@@ -16,6 +16,11 @@ if is_sunny:
 else:
   print("I like it when it's not sunny.")
 
+# the innermost check flattened into one condition - cheapest test first,
+# and it stops as soon as one part is False
+if is_sunny and temp_in_celcius > 20 and has_airconditioning:
+  print("Flat check: sunny, hot and we have aircon.")
+
 if is_sunny and temp_in_celcius > 20:
   print("Whack on the airconditioning (sorry planet)!") 
 
@@ -7,6 +7,9 @@ print(type(empty_tuple))
 #               0       1        2          3     <- index or position
 name_tuple = ("Rob", "Aimee", "Gonzalo", "Graeme")
 
+# build a lookup of name -> index once, rather than scanning the tuple each time
+name_index = {name: index for index, name in enumerate(name_tuple)}
+
 print(name_tuple[2])
 print(name_tuple[1:])
 print(name_tuple[:2])
@@ -15,7 +18,7 @@ print(name_tuple[1:3])
 print("Kevin" in name_tuple)  # check for membership
 print("Rob" in name_tuple)
 
-if "Kevin" not in name_tuple:
+if "Kevin" not in name_index:
   print("Unauthorized.")
 else:
   print("Here's the data.")
@@ -27,8 +30,8 @@ print(name_tuple.count("Kevin"))
 
 name_to_look_for = "Gonzalo"
 
-if name_to_look_for in name_tuple:
-  print(f"{name_to_look_for} is at index {name_tuple.index(name_to_look_for)}")
+if name_to_look_for in name_index:
+  print(f"{name_to_look_for} is at index {name_index[name_to_look_for]}")
 else:
   print(f"{name_to_look_for} is not in tuple.")
 
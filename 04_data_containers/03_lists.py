@@ -24,8 +24,7 @@ print(beatles_list)
 
 print(beatles_list.count("John"))
 
-while "John" in beatles_list:
-  beatles_list.remove("John")
+beatles_list[:] = [beatle for beatle in beatles_list if beatle != "John"]
 
 print(beatles_list)
 
@@ -22,16 +22,11 @@ history = [
     (10, "message"),
 ]
 
-total = 0
-lowest_value = 9999
-highest_value = -9999
+answers = [answer for answer, message in history]
 
-for answer, message in history:
-    total = total + answer
-    if lowest_value > answer:
-        lowest_value = answer
-    if highest_value < answer:
-        highest_value = answer
+total = sum(answers)
+lowest_value = min(answers)
+highest_value = max(answers)
 
 print(f'The lowest value entered: {lowest_value}')
 print(f'The highest value entered: {highest_value}')
@@ -1,10 +1,15 @@
 import random
+import sys
 
 # Set up some constants for the game
 MIN_VALUE = 1
 MAX_VALUE = 10
 MAX_NUMBER_OF_GUESSES = 4
 GUESS_PROMPT = f'Please guess a number between {MIN_VALUE} and {MAX_VALUE}: '
+WELCOME_MESSAGE = 'Welcome to the number guess game'
+THINKING_MESSAGE = f"I'm thinking of a number between {MIN_VALUE} and {MAX_VALUE}"
+NO_ANSWERS = frozenset(('n', 'no'))
+YES_ANSWERS = frozenset(('y', 'yes'))
 
 # Set up variables to be used in the game
 game_ongoing = True
@@ -13,22 +18,25 @@ while game_ongoing:
     # Generate a random number for this game
     number_to_guess = random.randint(MIN_VALUE, MAX_VALUE)
 
-    # Creates a history list
-    history = []
+    # Creates the history lists, one for guesses and one for messages
+    guesses = []
+    messages = []
 
     # Initialize the number of tries the player has made
     count_number_of_tries = 0
     
     # Start the game
-    print('Welcome to the number guess game')
-    print(f"I'm thinking of a number between {MIN_VALUE} and {MAX_VALUE}")
+    print(WELCOME_MESSAGE)
+    print(THINKING_MESSAGE)
     
     # Track whether the number has been guessed
     number_not_guessed = True
     
     while number_not_guessed:
         # Get the player's guess
-        guess = int(input(GUESS_PROMPT))
+        sys.stdout.write(GUESS_PROMPT)
+        sys.stdout.flush()
+        guess = int(sys.stdin.readline())  # int() ignores the trailing newline
         
         # Check for cheat code (-1)
         if guess == -1:
@@ -57,7 +65,8 @@ Your guess was lower than the number"""
 Your guess was higher than the number"""
             print(message)
         
-        history.append((guess, message))
+        guesses.append(guess)
+        messages.append(message)
 
         # Check if they've exceeded the maximum number of attempts
         if count_number_of_tries == MAX_NUMBER_OF_GUESSES:
@@ -75,8 +84,8 @@ Your guess was higher than the number"""
 
     print("Your guesses were: ")
     # for(let i = 0; i < 10; i++)
-    for index, guess in enumerate(history, 1):
-        print(f"Guess {index} was {guess[0]} with the message: {guess[1]}")
+    for index, (previous_guess, previous_message) in enumerate(zip(guesses, messages), 1):
+        print(f"Guess {index} was {previous_guess} with the message: {previous_message}")
 
     # Ask if they want to play again
     input_not_accepted = True
@@ -84,10 +93,10 @@ Your guess was higher than the number"""
         play_again = input("Do you want to play again (y/n) or (yes/no)? ")
         play_again = play_again.lower()
         
-        if play_again == 'n' or play_again == 'no':
+        if play_again in NO_ANSWERS:
             game_ongoing = False
             input_not_accepted = False
-        elif play_again == 'y' or play_again == 'yes':
+        elif play_again in YES_ANSWERS:
             input_not_accepted = False
         else:
             print('Invalid input must be y/n or yes/no')
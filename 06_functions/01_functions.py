@@ -1,12 +1,13 @@
+import sys
+
 # function keyword -> def
 #   name_of_the_function
 def print_message(message, divider_symbol="=", divider_length=20):  # function header/definition
   """
   A function to print a message with a header and footer.
   """
-  print(divider_symbol * divider_length)
-  print(message)
-  print(divider_symbol * divider_length)
+  divider = divider_symbol * divider_length
+  sys.stdout.write(f"{divider}\n{message}\n{divider}\n")
 
 
 #  1 required positional argument: 'message'
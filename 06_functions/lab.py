@@ -35,14 +35,13 @@ def get_discounted_price(original_price, percentage_discount):
   discounted_price = original_price - discount_amount
   return (discounted_price, discount_amount)  
 
+PROMOTION_DISCOUNTS = {"SAVE10": 0.1, "SAVE20": 0.2, "SAVE30": 0.3}
+
 def apply_promotion_code(original_price, discount_code):
-  if discount_code == "SAVE10":
-    return get_discounted_price(original_price, 0.1)
-  elif discount_code == "SAVE20":
-    return get_discounted_price(original_price, 0.2) 
-  elif discount_code == "SAVE30":
-    return get_discounted_price(original_price, 0.3) 
-  elif discount_code == "FREESHIP":
+  percentage_discount = PROMOTION_DISCOUNTS.get(discount_code)
+  if percentage_discount is not None:
+    return get_discounted_price(original_price, percentage_discount)
+  if discount_code == "FREESHIP":
     return (0, original_price)
   return (original_price, 0)
 
@@ -15,6 +15,8 @@ for product in products:
 
 
 # Pythonic - Python idiomatic - List Comprehension
+# It is also faster: each item is added with the LIST_APPEND opcode instead of
+# looking up and calling the .append method on every pass of the loop
 product_names = [product[0] for product in products]
 
 # Calculate prices with tax (20%)
@@ -27,6 +29,13 @@ def calculate_with_tax(price, tax_rate):
 prices_with_tax = [calculate_with_tax(product[1], 0.2) for product in products]
 print(prices_with_tax)
 
+# For a big catalogue, NumPy does the whole multiply in one C loop
+import numpy as np
+
+prices = np.fromiter((product[1] for product in products), dtype=np.float64, count=len(products))
+prices_with_tax = np.round(prices * 1.2, 2).tolist()
+print(prices_with_tax)
+
 # Display string  (f"{p[0]} - £{p[1]}")
 display_strings = [f"{p[0]} - £{p[1]:.2f}" for p in products]
 print(display_strings)
\ No newline at end of file
@@ -24,7 +24,9 @@ expensive_electronics = [p for p in products if p[2] == "Electronics" and p[1] >
 print(expensive_electronics)
 
 
-total_sales = sum(p[4] for p in products)  # aggregator function
+from operator import itemgetter
+
+total_sales = sum(map(itemgetter(4), products))  # aggregator function
 print(total_sales)
 
 net_income = sum(p[4] * p[1] for p in products)
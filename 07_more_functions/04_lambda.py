@@ -22,14 +22,19 @@ products = [
     ("Monitor Stand", 35.00, "Furniture", 40, 25),
 ] 
 
+# operator.itemgetter builds the same kind of key function in C
+from operator import itemgetter
+
 def get_price_from_product(product):
   return product[1]
 
 most_expensive = max(products, key=get_price_from_product)
 most_expensive = max(products, key=lambda p: p[1])
+most_expensive = max(products, key=itemgetter(1))
 print(most_expensive)
 
 best_seller = max(products, key=lambda p: p[4])
+best_seller = max(products, key=itemgetter(4))
 print(best_seller)
 
 def get_sales_and_price(product):
@@ -37,6 +42,7 @@ def get_sales_and_price(product):
 
 products.sort(key=get_sales_and_price)
 products.sort(key=lambda p: (p[4], p[1]))
+products.sort(key=itemgetter(4, 1))
 
 for product in products:
   print(product)
@@ -14,6 +14,8 @@ print(type(employee1))
 import datetime
 
 class Employee:
+  __slots__ = ("name", "employee_id", "department", "salary", "start_date", "skills", "created_at")
+
   def __init__(self, name, employee_id, department, salary, start_date):
     self.name = name
     self.employee_id = employee_id
@@ -28,7 +30,14 @@ class Employee:
 
   def give_raise(self, percent):
     """Give employee raise by given percent (10 rather than 0.1)"""
-    self.salary = self.salary * (1 + percent / 100)
+    self.salary *= 1 + percent / 100
+
+  @classmethod
+  def bulk_raise(cls, employees, percent):
+    """Give every employee the same raise, working out the factor once"""
+    factor = 1 + percent / 100
+    for employee in employees:
+      employee.salary *= factor
   
   def add_skill(self, skill):
     self.skills.append(skill)
@@ -62,7 +71,12 @@ print(employee2.salary)
 # Load file -> extract the data -> make classes from data 
 
 class CrimeLocation:
-  pass
+  __slots__ = ("id", "long", "lat")
+
+  def __init__(self, id, long, lat):
+    self.id = id
+    self.long = long
+    self.lat = lat
 
   def distance_from(self, lng, lat):
     pass
@@ -76,4 +90,16 @@ for row in spreadsheet_rows:
 
 
 
-near_city_centre = [c for c in crime_locations if c.distance_from(56,23) < 100]
\ No newline at end of file
+near_city_centre = [c for c in crime_locations if c.distance_from(56,23) < 100]
+
+# For millions of rows, keep each column in its own NumPy array instead and
+# check every location at once - comparing squared distances skips the sqrt
+import numpy as np
+
+ids = np.array([row[3] for row in spreadsheet_rows])
+lngs = np.fromiter((row[6] for row in spreadsheet_rows), dtype=np.float64)
+lats = np.fromiter((row[7] for row in spreadsheet_rows), dtype=np.float64)
+
+dx = lngs - 56.0
+dy = lats - 23.0
+near_city_centre_ids = ids[dx * dx + dy * dy < 100.0 * 100.0]
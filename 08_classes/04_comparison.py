@@ -1,4 +1,6 @@
 class Employee:
+  __slots__ = ("name", "employee_id", "department", "salary", "start_date", "skills")
+
   def __init__(self, name, employee_id, department, salary, start_date):
     self.name = name
     self.employee_id = employee_id
@@ -12,7 +14,14 @@ class Employee:
 
   def give_raise(self, percent):
     """Give employee raise by given percent (10 rather than 0.1)"""
-    self.salary = self.salary * (1 + percent / 100)
+    self.salary *= 1 + percent / 100
+
+  @classmethod
+  def bulk_raise(cls, employees, percent):
+    """Give every employee the same raise, working out the factor once"""
+    factor = 1 + percent / 100
+    for employee in employees:
+      employee.salary *= factor
   
   def add_skill(self, skill):
     self.skills.append(skill)
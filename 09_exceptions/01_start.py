@@ -2,22 +2,22 @@ registered_users = {}
 
 def register_user(email, name, age):
     """Register a new user."""
-    # What if email is already taken?
-    if email in registered_users:
+    # What if name is empty?
+    if not name:
         # Program crashes! 💥
-        return "Error: Email already exists"
-    
+        return "Error: Name required"
+
     # What if age is negative?
     if age < 0:
         # Program crashes! 💥
         return "Error: Age must be positive"
-    
-    # What if name is empty?
-    if not name:
+
+    # What if email is already taken?
+    user = {"name": name, "age": age}
+    if registered_users.setdefault(email, user) is not user:
         # Program crashes! 💥
-        return "Error: Name required"
-    
-    registered_users[email] = {"name": name, "age": age}
+        return "Error: Email already exists"
+
     return "User registered successfully"
 
 result = register_user("alice@example.com", "Alice", 25)
@@ -3,20 +3,22 @@ registered_users = {}
 
 def register_user(email, name, age):
     """Register a new user."""
-    # What if email is already taken?
-    if email in registered_users:
+    # What if name is empty?
+    if not name:
         # Program crashes! 💥
-        raise EmailAlreadyExists(f"Email already exists. {email}")
-    
+        raise ValueError("Name required")
+
     # What if age is negative?
     if age < 0:
         # Program crashes! 💥
         raise ValueError("Age must be positive")
-    
-    # What if name is empty?
-    if not name:
+
+    # What if email is already taken?
+    # setdefault checks and inserts with a single lookup - if we get back a
+    # different dict, someone else already had the email.
+    user = {"name": name, "age": age}
+    if registered_users.setdefault(email, user) is not user:
         # Program crashes! 💥
-        raise ValueError("Name required")
-    
-    registered_users[email] = {"name": name, "age": age}
+        raise EmailAlreadyExists(f"Email already exists. {email}")
+
     return "User registered successfully"
\ No newline at end of file
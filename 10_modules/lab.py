@@ -1,7 +1,34 @@
+import numpy as np
+
 def filter_data(data, condition_func):
     """Filter data based on a condition function."""
     return [item for item in data if condition_func(item)]
 
+def filter_data_np(data, mask_func):
+    """Filter numeric data with a vectorised condition that returns a boolean array."""
+    array = np.asarray(data)
+    return array[mask_func(array)]
+
+NUMERIC_FILTERS = {
+    "lt": np.less,
+    "le": np.less_equal,
+    "eq": np.equal,
+    "ge": np.greater_equal,
+    "gt": np.greater,
+}
+
+def filter_numeric(data, op, threshold):
+    """Filter numeric data by a named comparison ("lt", "le", "eq", "ge" or "gt") against threshold."""
+    if op not in NUMERIC_FILTERS:
+        raise ValueError(f"Unknown op {op!r} - expected one of {', '.join(NUMERIC_FILTERS)}")
+    array = np.asarray(data)
+    return array[NUMERIC_FILTERS[op](array, threshold)]
+
+def filter_even(data):
+    """Keep only the even numbers, in one vectorised pass."""
+    array = np.asarray(data)
+    return array[np.remainder(array, 2) == 0]
+
 numbers = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
 words = ["apple", "banana", "kiwi", "grape", "pear", "strawberry"]
 people = [
@@ -11,8 +38,10 @@ people = [
   {"name": "Diana", "age": 15},
 ]
 
-print(filter_data(numbers, lambda x: x < 5))
+print(filter_data_np(numbers, lambda a: a < 5))  # ints/floats only - words stay on filter_data
 print(filter_data(words, lambda x: len(x) > 5))
+print(filter_even(numbers))
+print(filter_numeric(numbers, "gt", 7))
 
 
 # Example conditions
@@ -1,16 +1,20 @@
 """User management functions."""
 
 users = []
+_users_by_email = {}
 
 def add_user(name, email, role="user"):
     """Add a new user."""
     user = {"name": name, "email": email, "role": role}
+    # keep the first user for an email, matching the old linear search
+    _users_by_email.setdefault(email, user)
     users.append(user)
     return user
 
 def find_user_by_email(email):
     """Find user by email."""
-    for user in users:
-        if user["email"] == email:
-            return user
-    return None
\ No newline at end of file
+    return _users_by_email.get(email)
+
+def user_exists(email):
+    """Check whether a user with this email has been added."""
+    return email in _users_by_email
\ No newline at end of file
@@ -3,7 +3,6 @@ from . import user_functions
 def generate_user_list():
     """Generate formatted user list."""
     users = user_functions.users
-    report = "User List:\n"
-    for user in users:
-        report += f"- {user['name']} ({user['email']})\n"
-    return report
\ No newline at end of file
+    lines = ["User List:\n"]
+    lines.extend(f"- {user['name']} ({user['email']})\n" for user in users)
+    return "".join(lines)
\ No newline at end of file
@@ -1,10 +1,13 @@
 """User validation functions."""
 
+import re
+
+# compiled once at import rather than on every call
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
 def validate_email(email):
     """Validate email format."""
-    if not email or "@" not in email:
-        return False
-    return True
+    return bool(email) and _EMAIL_RE.match(email) is not None
 
 def validate_name(name):
     """Validate name."""
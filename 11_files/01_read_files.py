@@ -1,20 +1,17 @@
 file = None
 try:
-  file = open("test.txt") 
+  file = open("test.txt", encoding="utf-8")  # say which encoding rather than relying on the system default
   contents = file.read()  # loads the whole file into a string 
   print(contents)
   print(type(contents))
 
-  file.seek(0)  # move the cursor back ot the start of the file.
-  contents = file.readlines()  # creates a list with each line as a string
-  print([line.strip() for line in contents])
-  print(type(contents))
-  
-  file.seek(0)
-  line = file.readline()
-  while line:
+  # we already have the whole file, so split it rather than reading it again
+  lines = contents.splitlines()  # creates a list with each line as a string
+  print([line.strip() for line in lines])
+  print(type(lines))
+
+  for line in lines:
     print(line.strip())
-    line = file.readline()
 
 except FileNotFoundError:
   print("Could not find file.")
@@ -7,4 +7,17 @@
 # mode="a" -> appends to the end of an existing file
 from datetime import datetime
 with open("log.txt", mode="a") as file:
-  file.write(f"{datetime.now()} - still learning Python\n")
\ No newline at end of file
+  file.write(f"{datetime.now()} - still learning Python\n")
+
+# For a log you write to again and again, let the logging module keep the
+# file open (it appends, like mode="a") instead of reopening it every time.
+# Use it instead of the with block above, not as well:
+# import logging
+#
+# logging.basicConfig(
+#   filename="log.txt",
+#   level=logging.INFO,
+#   format="%(asctime)s.%(msecs)03d - %(message)s",  # milliseconds, not microseconds
+#   datefmt="%Y-%m-%d %H:%M:%S",
+# )
+# logging.info("still learning Python")
\ No newline at end of file
@@ -1,11 +1,17 @@
 import csv
 
-with open("movies.csv", mode="a") as file:
-  writer = csv.DictWriter(file, fieldnames=["Title", "Year","Director", "Genre"])
-
-  writer.writerow({
+# collect the new rows and write them in one writerows call
+rows = [
+  {
     "Title": "Speed",
     "Year":  1994,
     "Director": "Jan de Bont",
     "Genre": "Action"
-  })
\ No newline at end of file
+  },
+]
+
+# newline="" lets the csv module handle line endings itself
+with open("movies.csv", mode="a", newline="", buffering=1 << 20) as file:
+  writer = csv.DictWriter(file, fieldnames=["Title", "Year","Director", "Genre"])
+
+  writer.writerows(rows)
\ No newline at end of file
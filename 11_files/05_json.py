@@ -1,11 +1,14 @@
 import csv
 import json
+from textwrap import indent
 
-with open("movies.csv") as file:
-  reader = csv.DictReader(file)
-  movies = []
+# Stream each row straight from the csv reader into the json file rather than
+# building a list of every movie first - the output matches json.dumps(movies, indent=2)
+with open("movies.csv") as csv_file, open("movies.json", mode="w") as json_file:
+  reader = csv.DictReader(csv_file)
+  separator = "[\n"
   for row in reader:
-    movies.append(row)
-
-with open("movies.json", mode="w") as file:
-  file.write(json.dumps(movies, indent=2))
\ No newline at end of file
+    json_file.write(separator)
+    json_file.write(indent(json.dumps(row, indent=2), "  "))
+    separator = ",\n"
+  json_file.write("[]" if separator == "[\n" else "\n]")
\ No newline at end of file
@@ -1,14 +1,19 @@
 from movieclass import Movie
 import csv
+import sys
 
 with open("movies.csv") as file:
   reader = csv.DictReader(file)
   # next(reader)  
-  movies = []
-  for row in reader:
-    movies.append(Movie(row["Title"], row["Year"], row["Director"], row["Genre"]))
-
-print([m.to_dict() for m in movies if m.years_since_release() > 10])
+  # a generator builds each Movie only as it is needed, so we filter while
+  # reading instead of holding every row in memory first.
+  # Directors and genres repeat a lot, so sys.intern shares one string per value,
+  # and the year is converted to an int once here.
+  movies = (
+    Movie(row["Title"], int(row["Year"]), sys.intern(row["Director"]), sys.intern(row["Genre"]))
+    for row in reader
+  )
+  print([m.to_dict() for m in movies if m.years_since_release() > 10])
 
 with open("movies.csv", mode="a") as file:
   writer = csv.DictWriter(file, fieldnames=["Title", "Year", "Director", "Genre"])
@@ -1,6 +1,11 @@
 from datetime import date
 
+# looked up once when the module loads rather than once per movie
+CURRENT_YEAR = date.today().year
+
 class Movie:
+  __slots__ = ("title", "year", "director", "genre")
+
   def __init__(self, title, year, director, genre):
     self.title = title
     self.year = year
@@ -19,4 +24,4 @@ class Movie:
     }
   
   def years_since_release(self):
-    return date.today().year - int(self.year) 
\ No newline at end of file
+    return CURRENT_YEAR - int(self.year) 
\ No newline at end of file
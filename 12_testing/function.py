@@ -6,13 +6,11 @@
 #     - "express": £7.99
 #     - "overnight": £12.99
 
+SHIPPING_RATES = {"standard": 3.99, "express": 7.99, "overnight": 12.99}
+
 def calculate_shipping(subtotal, shipping_method="standard", free_shipping_threshold=50):
   if subtotal > free_shipping_threshold:
     return 0
   
-  if shipping_method == "express":
-    return 7.99
-  elif shipping_method == "overnight":
-    return 12.99
-  return 3.99 
+  return SHIPPING_RATES.get(shipping_method, SHIPPING_RATES["standard"])
 
@@ -19,6 +19,9 @@ def test_shipping_with_low_cost_and_express_comes_back_right():
 def test_shipping_with_low_cost_and_overnight_comes_back_right():
   assert calculate_shipping(5, "overnight") == 12.99
 
+def test_shipping_with_unknown_method_comes_back_with_standard_rate():
+  assert calculate_shipping(5, "carrier pigeon") == 3.99
+
 def test_shipping_above_50_should_give_0():
   assert calculate_shipping(100) == 0
 
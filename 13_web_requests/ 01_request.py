@@ -1,15 +1,20 @@
 import requests
-import json
+import shutil
 from requests import HTTPError
 
+# one session keeps the connection open and reuses it for later requests
+session = requests.Session()
+
 try: 
-  response = requests.get("https://pokeapi.co/api/v2/pokemon/ditto")
-  print(response)  # <Response [200]>
-  response.raise_for_status()
-  data = response.json()
+  # we only save the JSON, so copy the bytes straight to the file rather than
+  # parsing them with .json() and writing them back out again
+  with session.get("https://pokeapi.co/api/v2/pokemon/ditto", stream=True) as response:
+    print(response)  # <Response [200]>
+    response.raise_for_status()
+    response.raw.decode_content = True  # undo any gzip from the server
 
-  with open("ditto.json", mode="w") as file:
-    file.write(json.dumps(data, indent=2))
+    with open("ditto.json", mode="wb") as file:
+      shutil.copyfileobj(response.raw, file)
 except requests.HTTPError as e:
   print(f"Something went wrong: {e}")
 
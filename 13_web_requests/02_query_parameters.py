@@ -1,18 +1,24 @@
 import requests
-import json
+import shutil
 from requests import HTTPError
 
+# one session keeps the connection open and reuses it for later requests
+session = requests.Session()
+
 try: 
-  response = requests.get("https://pokeapi.co/api/v2/pokemon", 
-                            params={"offset": 10, "limit": 10}, 
-                            headers={"Authorization": "Bearer asdasdasd"},
-                            timeout=3)
-  print(response)  # <Response [200]>
-  response.raise_for_status()
-  data = response.json()
-  print(response.url)
-  with open("pokemon.json", mode="w") as file:
-    file.write(json.dumps(data, indent=2))
+  # we only save the JSON, so copy the bytes straight to the file rather than
+  # parsing them with .json() and writing them back out again
+  with session.get("https://pokeapi.co/api/v2/pokemon", 
+                   params={"offset": 10, "limit": 10}, 
+                   headers={"Authorization": "Bearer asdasdasd"},
+                   timeout=3,
+                   stream=True) as response:
+    print(response)  # <Response [200]>
+    response.raise_for_status()
+    print(response.url)
+    response.raw.decode_content = True  # undo any gzip from the server
+    with open("pokemon.json", mode="wb") as file:
+      shutil.copyfileobj(response.raw, file)
 except requests.HTTPError as e:
   print(f"Something went wrong: {e}")
 
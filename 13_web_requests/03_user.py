@@ -3,6 +3,9 @@ import json
 from requests import HTTPError
 from pathlib import Path
 
+# one session keeps the connection open and reuses it for later requests
+session = requests.Session()
+
 def get_and_save_pokemon_details(pokemon):
   try: 
     file_path = Path(f"{pokemon}.json")
@@ -10,13 +13,16 @@ def get_and_save_pokemon_details(pokemon):
     if file_path.exists():
       with open(file_path) as file:
         return json.load(file)
-    response = requests.get(f"https://pokeapi.co/api/v2/pokemon/{pokemon}")
+    response = session.get(f"https://pokeapi.co/api/v2/pokemon/{pokemon}")
     print(response)  # <Response [200]>
     response.raise_for_status()
     data = response.json()
 
-    with open(f"{pokemon}.json", mode="w") as file:
-      file.write(json.dumps(data, indent=2))
+    # write to a temporary file and then swap it into place, so a crash
+    # part way through never leaves a half-written cache file behind
+    tmp_path = file_path.with_suffix(".json.tmp")
+    tmp_path.write_bytes(json.dumps(data).encode())
+    tmp_path.replace(file_path)
     return data
   except requests.HTTPError as e:
     print(f"Something went wrong: {e}")
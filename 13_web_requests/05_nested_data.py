@@ -1,19 +1,37 @@
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
 from requests import HTTPError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# how many requests we allow in flight at once - the connection pool and the
+# thread pool are sized together so no thread waits for a free connection
+MAX_IN_FLIGHT = 20
+
+# one session keeps the connection open and reuses it for later requests
+session = requests.Session()
+session.mount("https://", HTTPAdapter(pool_connections=MAX_IN_FLIGHT, 
+                                      pool_maxsize=MAX_IN_FLIGHT, 
+                                      max_retries=Retry(total=3, backoff_factor=0.2)))
+
+def save_pokemon(result):
+  response = session.get(result.get("url"))
+  data = response.json()
+  with open(f"{result.get("name")}.json", mode="w") as file:
+    file.write(json.dumps(data, indent=2))
 
 try: 
-  response = requests.get("https://pokeapi.co/api/v2/pokemon", 
-                            params={"offset": 10, "limit": 50}, 
-                          )
+  response = session.get("https://pokeapi.co/api/v2/pokemon", 
+                         params={"offset": 10, "limit": 50}, 
+                        )
   response.raise_for_status()
   data = response.json()
   results = data.get("results", [])
-  for result in results:
-    response = requests.get(result.get("url"))
-    data = response.json()
-    with open(f"{result.get("name")}.json", mode="w") as file:
-      file.write(json.dumps(data, indent=2))
+  # each request spends most of its time waiting on the network, so threads
+  # can have several in flight at once
+  with ThreadPoolExecutor(max_workers=MAX_IN_FLIGHT) as executor:
+    list(executor.map(save_pokemon, results))
 except requests.HTTPError as e:
   print(f"Something went wrong: {e}")
 
@@ -1,7 +1,12 @@
 import requests
 
-response = requests.get("https://cdn.wsform.com/wp-content/uploads/2020/06/industry.csv")
-data = response.content
+# one session keeps the connection open and reuses it for later requests
+session = requests.Session()
 
-with open("industry.csv", mode="wb") as file:  # wb if you are working with non-text
-  file.write(data)
\ No newline at end of file
+# stream=True downloads the body in chunks as we write it, instead of holding
+# the whole file in memory first
+with session.get("https://cdn.wsform.com/wp-content/uploads/2020/06/industry.csv", stream=True) as response:
+  response.raise_for_status()
+  with open("industry.csv", mode="wb") as file:  # wb if you are working with non-text
+    for chunk in response.iter_content(chunk_size=1 << 16):
+      file.write(chunk)
\ No newline at end of file
@@ -5,16 +5,93 @@ CRUD = Create, Read, Update, Delete
 These functions provide a clean interface for database operations.
 """
 
-from sqlalchemy.exc import IntegrityError
-from database import Session
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+
+from sqlalchemy import bindparam, case, delete, insert, lambda_stmt, select, text, update
+from sqlalchemy.exc import IntegrityError, OperationalError
+from database import engine, session_scope
 from models import Author
 
 
+# Statements built once and reused, so each call only binds new values.
+# Only the columns are selected, so no ORM Author object is built per lookup.
+_GET_AUTHOR_BY_ID = select(
+    Author.author_id,
+    Author.name,
+    Author.email,
+    Author.country,
+    Author.created_at
+).where(Author.author_id == bindparam("author_id"))
+
+# Rows fetched per batch when streaming authors
+_STREAM_BATCH_SIZE = 1000
+
+_ALL_AUTHORS_BY_NAME = (
+    select(Author)
+    .order_by(Author.name)
+    .execution_options(yield_per=_STREAM_BATCH_SIZE)
+)
+
+# Substring search through the authors_fts trigram index (see models.py)
+_SEARCH_AUTHORS_BY_NAME = select(Author).from_statement(text(
+    "SELECT authors.* FROM authors "
+    "JOIN authors_fts ON authors_fts.rowid = authors.rowid "
+    "WHERE authors_fts MATCH :query ORDER BY authors.name"
+))
+
+# The trigram tokenizer can only match terms of at least 3 characters
+_MIN_FTS_TERM_LENGTH = 3
+
+# Bulk inserts are split into chunks to stay under SQLite's bound-parameter limit
+_INSERT_CHUNK_SIZE = 500
+
+# Keys add_authors() accepts; created_at is left to the column default
+_INSERT_COLUMNS = ("author_id", "name", "email", "country")
+
+# Older SQLite builds (before 3.32) allow at most 999 bound parameters per statement
+_SQLITE_MAX_PARAMS = 999
+
+# Batch deletes bind each id once, in IN (...)
+_BATCH_ID_CHUNK_SIZE = 500
+
+# Columns update_authors() is allowed to change
+_UPDATABLE_COLUMNS = ("name", "email", "country")
+
+# Batch updates bind each id once in IN (...) plus an id/value pair per
+# changed column in the CASE expressions
+_UPDATE_CHUNK_SIZE = _SQLITE_MAX_PARAMS // (1 + 2 * len(_UPDATABLE_COLUMNS))
+
+# How many get_author_by_id results to keep cached
+_AUTHOR_CACHE_SIZE = 1024
+
+
+@dataclass(frozen=True)
+class AuthorRecord:
+    """
+    A read-only copy of an author's row.
+    
+    Unlike an Author, it isn't tied to a session, so it is safe to cache
+    and share between callers.
+    """
+    author_id: str
+    name: str
+    email: str | None
+    country: str | None
+    created_at: datetime | None
+
+
 # CREATE operations
 def add_author(author_id, name, email, country=None):
     """
     Add a new author to the database.
     
+    Each call is its own transaction. To add more than one author, use
+    add_authors() instead - one transaction for the whole batch is far
+    faster than calling this in a loop.
+    
     Args:
         author_id: Unique identifier for the author
         name: Author's full name
@@ -24,96 +101,315 @@ def add_author(author_id, name, email, country=None):
     Returns:
         bool: True if successful, False otherwise
     """
-    session = Session()
     try:
-        author = Author(
-            author_id=author_id,
-            name=name,
-            email=email,
-            country=country
-        )
-        session.add(author)
-        session.commit()
+        with session_scope() as session:
+            author = Author(
+                author_id=author_id,
+                name=name,
+                email=email,
+                country=country
+            )
+            session.add(author)
+        _fetch_author.cache_clear()  # the cached rows may now be out of date
         print(f"Author {author_id} added successfully")
         return True
     except IntegrityError as e:
-        session.rollback()
         print(f"Error: Author with ID {author_id} or email {email} already exists")
         return False
     except Exception as e:
-        session.rollback()
         print(f"Database error: {e}")
         return False
-    finally:
-        session.close()
+
+
+def add_authors(records):
+    """
+    Add several authors to the database in a single transaction.
+    
+    The rows are sent with one executemany INSERT per chunk instead of
+    going through the ORM one object at a time.
+    
+    Args:
+        records: List of dicts with author_id, name, email and
+            (optionally) country keys, e.g.
+            [{"author_id": "AUTH001", "name": "Jane Austen", "email": "jane@email.com"},
+             {"author_id": "AUTH002", "name": "Charles Dickens",
+              "email": "charles@email.com", "country": "United Kingdom"}]
+    
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        # executemany takes its column list from the first row, so give
+        # every row the same keys - a missing country is stored as None
+        rows = []
+        for record in records:
+            unknown = set(record) - set(_INSERT_COLUMNS)
+            if unknown:
+                raise ValueError(
+                    f"Unknown author fields: {', '.join(sorted(unknown))}"
+                )
+            rows.append({"country": None, **record})
+        
+        # engine.begin() commits once at the end, or rolls back on error
+        with engine.begin() as connection:
+            for start in range(0, len(rows), _INSERT_CHUNK_SIZE):
+                connection.execute(
+                    insert(Author), rows[start:start + _INSERT_CHUNK_SIZE]
+                )
+        _fetch_author.cache_clear()  # the cached rows may now be out of date
+        print(f"{len(rows)} authors added successfully")
+        return True
+    except IntegrityError as e:
+        print("Error: One or more authors already exist")
+        return False
+    except ValueError as e:
+        print(f"Error: {e}")
+        return False
+    except Exception as e:
+        print(f"Database error: {e}")
+        return False
+
+
+def load_dataframe(df, table_name="authors"):
+    """
+    Bulk-load a pandas DataFrame into a table.
+    
+    Uses multi-row INSERT ... VALUES (...), (...) statements, with as
+    many rows per statement as SQLite's bound-parameter limit allows.
+    Column defaults from the models (such as created_at) are not
+    applied, so include those columns in the DataFrame if you need them.
+    
+    Args:
+        df: DataFrame whose columns match the table's columns
+        table_name: Table to append to (default "authors")
+    
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        df.to_sql(
+            table_name,
+            engine,
+            if_exists="append",
+            index=False,
+            method="multi",
+            # every row binds one parameter per column
+            chunksize=max(1, _SQLITE_MAX_PARAMS // len(df.columns))
+        )
+        _fetch_author.cache_clear()  # the cached rows may now be out of date
+        print(f"{len(df)} rows loaded into {table_name} successfully")
+        return True
+    except Exception as e:  # pandas wraps driver errors, including duplicates
+        print(f"Database error: {e}")
+        return False
+
+
+async def add_author_async(author_id, name, email, country=None):
+    """
+    Async version of add_author for use inside an event loop.
+    
+    The blocking insert and commit run in a worker thread, so other
+    tasks keep running while SQLite writes. The call opens its own
+    session in the worker thread.
+    
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    return await asyncio.to_thread(add_author, author_id, name, email, country)
 
 
 # READ operations
+@lru_cache(maxsize=_AUTHOR_CACHE_SIZE)
+def _fetch_author(author_id):
+    """Load an author as an AuthorRecord (cached - cleared by every write)."""
+    with session_scope() as session:
+        row = session.execute(
+            _GET_AUTHOR_BY_ID, {"author_id": author_id}
+        ).first()
+    if row is None:
+        return None
+    return AuthorRecord(**row._mapping)
+
+
 def get_author_by_id(author_id):
     """
     Get an author by their ID.
     
+    Repeat lookups are served from a cache until the next add, update
+    or delete.
+    
+    Args:
+        author_id: Unique identifier for the author
+    
+    Returns:
+        AuthorRecord: Author details if found, None otherwise
+    """
+    try:
+        return _fetch_author(author_id)
+    except Exception as e:
+        print(f"Database error: {e}")
+        return None
+
+
+def get_author_orm_by_id(author_id):
+    """
+    Get an author by their ID as an ORM Author object.
+    
+    Use this when you need a mapped Author instance; otherwise prefer
+    get_author_by_id, which is cheaper and cached.
+    
     Args:
         author_id: Unique identifier for the author
     
     Returns:
         Author: Author object if found, None otherwise
     """
-    session = Session()
     try:
-        author = session.query(Author).filter(
-            Author.author_id == author_id
-        ).first()
+        with session_scope() as session:
+            author = session.get(Author, author_id)
         return author
     except Exception as e:
         print(f"Database error: {e}")
         return None
-    finally:
-        session.close()
 
 
 def get_all_authors():
     """
     Get all authors, ordered by name.
     
-    Returns:
-        list: List of Author objects
+    Rows are streamed in batches of 1000 rather than loaded all at once,
+    so the session stays open until the caller finishes iterating.
+    
+    Yields:
+        Author: Author objects, one at a time
+    
+    Raises:
+        Exception: Any database error, even part-way through, so a
+            failure is never mistaken for the end of the results
     """
-    session = Session()
     try:
-        authors = session.query(Author).order_by(Author.name).all()
-        return authors
+        with session_scope() as session:
+            for batch in session.scalars(_ALL_AUTHORS_BY_NAME).partitions():
+                yield from batch
     except Exception as e:
         print(f"Database error: {e}")
-        return []
-    finally:
-        session.close()
+        raise
 
 
 def search_authors_by_name(search_term):
     """
     Search authors by name (case-insensitive partial match).
     
+    Terms of 3+ characters use the authors_fts index, which
+    create_tables() sets up. Shorter terms, and databases created
+    before the index existed, fall back to a LIKE scan.
+    
     Args:
         search_term: Text to search for in author names
     
     Returns:
         list: List of matching Author objects
     """
-    session = Session()
     try:
-        authors = session.query(Author).filter(
-            Author.name.like(f"%{search_term}%")
-        ).order_by(Author.name).all()
+        with session_scope() as session:
+            authors = None
+            if len(search_term) >= _MIN_FTS_TERM_LENGTH:
+                # Quote the term so FTS5 treats it as plain text, not query syntax
+                query = '"' + search_term.replace('"', '""') + '"'
+                try:
+                    authors = session.scalars(
+                        _SEARCH_AUTHORS_BY_NAME, {"query": query}
+                    ).all()
+                except OperationalError:
+                    # No authors_fts table yet - create_tables() adds it
+                    session.rollback()
+            if authors is None:
+                authors = session.query(Author).filter(
+                    Author.name.like(f"%{search_term}%")
+                ).order_by(Author.name).all()
         return authors
     except Exception as e:
         print(f"Database error: {e}")
         return []
-    finally:
-        session.close()
 
 
 # UPDATE operations
+def _update_authors(session, changes):
+    """
+    Apply the changes for many authors with one UPDATE per chunk of ids.
+    
+    Each column becomes a CASE author_id WHEN ... THEN ... ELSE column END,
+    so authors that don't change a column keep their current value.
+    
+    Returns:
+        int: Number of authors updated
+    
+    Raises:
+        ValueError: If a change names a column that can't be updated
+    """
+    # Check every change up front so a typo doesn't pass as "0 updated"
+    for author_id, fields in changes.items():
+        unknown = set(fields) - set(_UPDATABLE_COLUMNS)
+        if unknown:
+            raise ValueError(
+                f"Cannot update {', '.join(sorted(unknown))} for author {author_id}"
+            )
+    
+    # Authors with nothing to change are left out of the WHERE clause
+    author_ids = [author_id for author_id, fields in changes.items() if fields]
+    updated = 0
+    for start in range(0, len(author_ids), _UPDATE_CHUNK_SIZE):
+        chunk = author_ids[start:start + _UPDATE_CHUNK_SIZE]
+        values = {}
+        for column in _UPDATABLE_COLUMNS:
+            whens = {
+                author_id: changes[author_id][column]
+                for author_id in chunk
+                if column in changes[author_id]
+            }
+            if whens:
+                values[column] = case(
+                    whens,
+                    value=Author.author_id,
+                    else_=getattr(Author, column)
+                )
+        if not values:
+            continue
+        result = session.execute(
+            update(Author)
+            .where(Author.author_id.in_(chunk))
+            .values(values)
+            .execution_options(synchronize_session=False)
+        )
+        updated += result.rowcount
+    return updated
+
+
+def update_authors(changes):
+    """
+    Update several authors in a single transaction.
+    
+    Args:
+        changes: Dict mapping author_id to a dict of the new values,
+            e.g. {"AUTH001": {"country": "England"}}
+    
+    Returns:
+        int: Number of authors updated, or None if the update failed
+    """
+    try:
+        with session_scope() as session:
+            updated = _update_authors(session, changes)
+        _fetch_author.cache_clear()  # the cached rows may now be out of date
+        print(f"{updated} authors updated successfully")
+        return updated
+    except (IntegrityError, ValueError) as e:
+        print(f"Error: {e}")
+        return None
+    except Exception as e:
+        print(f"Database error: {e}")
+        return None
+
+
 def update_author(author_id, name=None, email=None, country=None):
     """
     Update author information.
@@ -127,42 +423,79 @@ def update_author(author_id, name=None, email=None, country=None):
     Returns:
         bool: True if successful, False otherwise
     """
-    session = Session()
+    # Update only provided fields
+    fields = {
+        column: value
+        for column, value in (("name", name), ("email", email), ("country", country))
+        if value
+    }
     try:
-        # Get existing author
-        author = session.query(Author).filter(
-            Author.author_id == author_id
-        ).first()
+        with session_scope() as session:
+            if fields:
+                found = _update_authors(session, {author_id: fields}) > 0
+            else:
+                found = session.get(Author, author_id) is not None
         
-        if not author:
+        if not found:
             print(f"Author {author_id} not found")
             return False
         
-        # Update only provided fields
-        if name:
-            author.name = name
-        if email:
-            author.email = email
-        if country:
-            author.country = country
-        
-        # Commit changes
-        session.commit()
+        # Changes are committed when the with block ends
+        _fetch_author.cache_clear()  # the cached rows may now be out of date
         print(f"Author {author_id} updated successfully")
         return True
     except IntegrityError as e:
-        session.rollback()
         print(f"Error: {e}")
         return False
     except Exception as e:
-        session.rollback()
         print(f"Database error: {e}")
         return False
-    finally:
-        session.close()
 
 
 # DELETE operations
+def _delete_authors(session, author_ids):
+    """
+    Delete many authors with one DELETE ... WHERE author_id IN (...) per chunk.
+    
+    Returns:
+        int: Number of authors deleted
+    """
+    author_ids = list(author_ids)
+    deleted = 0
+    for start in range(0, len(author_ids), _BATCH_ID_CHUNK_SIZE):
+        chunk = author_ids[start:start + _BATCH_ID_CHUNK_SIZE]
+        # lambda_stmt builds and caches the statement once; later calls
+        # only bind the new chunk of ids
+        result = session.execute(lambda_stmt(
+            lambda: delete(Author)
+            .where(Author.author_id.in_(chunk))
+            .execution_options(synchronize_session=False)
+        ))
+        deleted += result.rowcount
+    return deleted
+
+
+def delete_authors(author_ids):
+    """
+    Delete several authors in a single transaction.
+    
+    Args:
+        author_ids: Iterable of author IDs to delete
+    
+    Returns:
+        int: Number of authors deleted, or None if the delete failed
+    """
+    try:
+        with session_scope() as session:
+            deleted = _delete_authors(session, author_ids)
+        _fetch_author.cache_clear()  # the cached rows may now be out of date
+        print(f"{deleted} authors deleted successfully")
+        return deleted
+    except Exception as e:
+        print(f"Database error: {e}")
+        return None
+
+
 def delete_author(author_id):
     """
     Delete an author from the database.
@@ -173,27 +506,18 @@ def delete_author(author_id):
     Returns:
         bool: True if successful, False otherwise
     """
-    session = Session()
     try:
-        # Get author to delete
-        author = session.query(Author).filter(
-            Author.author_id == author_id
-        ).first()
+        with session_scope() as session:
+            found = _delete_authors(session, [author_id]) > 0
         
-        if not author:
+        if not found:
             print(f"Author {author_id} not found")
             return False
         
-        # Delete the object
-        session.delete(author)
-        
-        # Commit deletion
-        session.commit()
+        # Deletion is committed when the with block ends
+        _fetch_author.cache_clear()  # the cached rows may now be out of date
         print(f"Author {author_id} deleted successfully")
         return True
     except Exception as e:
-        session.rollback()
         print(f"Database error: {e}")
-        return False
-    finally:
-        session.close()
+        return False
\ No newline at end of file
@@ -7,6 +7,7 @@ This demonstrates how to use the database functionality.
 from database import create_tables
 from crud import (
     add_author,
+    add_authors,
     get_author_by_id,
     get_all_authors,
     search_authors_by_name,
@@ -27,9 +28,11 @@ def main():
     
     # CREATE - Add authors
     print("\n2. Adding authors...")
-    add_author("AUTH001", "Jane Austen", "jane@email.com", "United Kingdom")
-    add_author("AUTH002", "Charles Dickens", "charles@email.com", "United Kingdom")
-    add_author("AUTH003", "Mark Twain", "mark@email.com", "United States")
+    add_authors([
+        {"author_id": "AUTH001", "name": "Jane Austen", "email": "jane@email.com", "country": "United Kingdom"},
+        {"author_id": "AUTH002", "name": "Charles Dickens", "email": "charles@email.com", "country": "United Kingdom"},
+        {"author_id": "AUTH003", "name": "Mark Twain", "email": "mark@email.com", "country": "United States"},
+    ])
     
     # READ - Get all authors
     print("\n3. All authors:")
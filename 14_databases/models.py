@@ -6,7 +6,7 @@ and define table structure using Column definitions.
 """
 
 from database import Base
-from sqlalchemy import Column, String, DateTime, ForeignKey, Integer
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, DDL, event
 from datetime import datetime
 
 
@@ -24,7 +24,8 @@ class Author(Base):
     __tablename__ = "authors"
     
     author_id = Column(String, primary_key=True)
-    name = Column(String, nullable=False)
+    # Indexed so ORDER BY name can walk the index instead of sorting the table
+    name = Column(String, nullable=False, index=True)
     email = Column(String, nullable=True, unique=True)
     country = Column(String)
     created_at = Column(DateTime, default=datetime.now)
@@ -34,6 +35,37 @@ class Author(Base):
         return f"<Author(author_id='{self.author_id}', name='{self.name}')>"
 
 
+# Full-text index over author names for search_authors_by_name.
+# A LIKE '%term%' search can't use a B-tree index and scans the whole table;
+# the trigram tokenizer lets SQLite answer substring matches from an index.
+# Triggers keep authors_fts in step with the authors table.
+_AUTHORS_FTS_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS authors_fts USING fts5(
+        name, content='authors', content_rowid='rowid', tokenize='trigram'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS authors_fts_insert AFTER INSERT ON authors BEGIN
+        INSERT INTO authors_fts(rowid, name) VALUES (new.rowid, new.name);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS authors_fts_delete AFTER DELETE ON authors BEGIN
+        INSERT INTO authors_fts(authors_fts, rowid, name) VALUES ('delete', old.rowid, old.name);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS authors_fts_update AFTER UPDATE ON authors BEGIN
+        INSERT INTO authors_fts(authors_fts, rowid, name) VALUES ('delete', old.rowid, old.name);
+        INSERT INTO authors_fts(rowid, name) VALUES (new.rowid, new.name);
+    END""",
+    # Re-index existing rows, e.g. a database created before the index existed
+    "INSERT INTO authors_fts(authors_fts) VALUES ('rebuild')",
+]
+
+# Tables that already exist aren't recreated by create_all(), so add the
+# name index to them here as well
+_AUTHORS_NAME_INDEX_DDL = "CREATE INDEX IF NOT EXISTS ix_authors_name ON authors (name)"
+
+# Runs after every Base.metadata.create_all(), so existing databases get it too
+for _statement in [_AUTHORS_NAME_INDEX_DDL, *_AUTHORS_FTS_DDL]:
+    event.listen(Base.metadata, "after_create", DDL(_statement))
+
+
 class Book(Base):
     """
     Book model - represents books table.
@@ -4,27 +4,28 @@ import numpy as np
 math_scores = [85, 92, 78, 88, 95]
 science_scores = [90, 88, 85, 92, 89]
 
-bonus_math = []
-for score in math_scores:
-    bonus_math.append(score + 5)
-
-# To calculate average:
-avg_math = sum(math_scores) / len(math_scores)
-
-# To add math and science scores together:
-total_scores = []
-for i in range(len(math_scores)):
-    total_scores.append(math_scores[i] + science_scores[i])
-
-
-math_scores_np = np.array(math_scores)
-science_scores_np = np.array(science_scores)
+# Without NumPy you would loop over every score in Python:
+#
+# bonus_math = []
+# for score in math_scores:
+#     bonus_math.append(score + 5)
+#
+# avg_math = sum(math_scores) / len(math_scores)
+#
+# total_scores = []
+# for i in range(len(math_scores)):
+#     total_scores.append(math_scores[i] + science_scores[i])
+
+# With NumPy each operation works on the whole array in one go.
+# Scores are 0-100, so int16 is plenty and uses a quarter of the memory of int64.
+math_scores_np = np.asarray(math_scores, dtype=np.int16)
+science_scores_np = np.asarray(science_scores, dtype=np.int16)
 math_scores_with_bonus = math_scores_np + 5  # vector maths
 print(math_scores_np, math_scores_with_bonus)
 
 print(math_scores_np.mean())
 print(math_scores_np + science_scores_np)
 
-numbers = np.linspace(0, 100, 17)
+numbers = np.linspace(0, 100, 17, dtype=np.float32)  # half the bytes of float64
 print(numbers)
-print(np.std(math_scores_np))
\ No newline at end of file
+print(np.std(math_scores_np, dtype=np.float32))  # float32 is plenty of precision for scores
\ No newline at end of file